@@ -1,9 +1,9 @@
 from pathlib import Path
 from typing import List, Optional
 
-from demisto_sdk.commands.common.handlers import JSON_Handler
+from demisto_sdk.commands.common.handlers import OrJSON_Handler
 
-json = JSON_Handler()
+json = OrJSON_Handler()
 
 
 class ConfJSON:
@@ -32,7 +32,8 @@ class ConfJSON:
             unmockable_integrations = []
         if docker_thresholds is None:
             docker_thresholds = {}
-        self._file_path.write_text(
+        # _file_path may be a py.path.local (Repo built from tmpdir), which has no write_bytes
+        Path(self._file_path).write_bytes(
             json.dumps(
                 {
                     "tests": tests,
@@ -41,6 +42,5 @@ class ConfJSON:
                     "unmockable_integrations": unmockable_integrations,
                     "docker_thresholds": docker_thresholds,
                 }
-            ),
-            None,
+            )
         )
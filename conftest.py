@@ -1,36 +1,41 @@
 """Configuring tests for the content suite
 """
-from typing import Generator
+import sys
+from typing import TYPE_CHECKING, Generator
 from unittest import mock
 
 import pytest
 from _pytest.fixtures import FixtureRequest
 from _pytest.tmpdir import TempPathFactory, _mk_tmp
 
-import demisto_sdk.commands.common.tools as tools
-from TestSuite.integration import Integration
-from TestSuite.json_based import JSONBased
-from TestSuite.pack import Pack
-from TestSuite.playbook import Playbook
-from TestSuite.repo import Repo
-from TestSuite.yml import YAML
+# The TestSuite and demisto_sdk modules are imported where they are used,
+# so loading this conftest does not import the whole SDK before collection.
+if TYPE_CHECKING:
+    from TestSuite.integration import Integration
+    from TestSuite.json_based import JSONBased
+    from TestSuite.pack import Pack
+    from TestSuite.playbook import Playbook
+    from TestSuite.repo import Repo
+    from TestSuite.yml import YAML
 
 # Helper Functions
 
 
-def get_repo(request: FixtureRequest, tmp_path_factory: TempPathFactory) -> Repo:
+def get_repo(request: FixtureRequest, tmp_path_factory: TempPathFactory) -> "Repo":
+    from TestSuite.repo import Repo
+
     tmp_dir = _mk_tmp(request, tmp_path_factory)
     return Repo(tmp_dir)
 
 
-def get_pack(request: FixtureRequest, tmp_path_factory: TempPathFactory) -> Pack:
+def get_pack(request: FixtureRequest, tmp_path_factory: TempPathFactory) -> "Pack":
     """Mocking tmp_path"""
     return get_repo(request, tmp_path_factory).create_pack()
 
 
 def get_integration(
     request: FixtureRequest, tmp_path_factory: TempPathFactory
-) -> Integration:
+) -> "Integration":
     """Mocking tmp_path"""
     integration = get_pack(request, tmp_path_factory).create_integration()
     integration.create_default_integration()
@@ -39,7 +44,7 @@ def get_integration(
 
 def get_playbook(
     request: FixtureRequest, tmp_path_factory: TempPathFactory
-) -> Playbook:
+) -> "Playbook":
     """Mocking tmp_path"""
     playbook = get_pack(request, tmp_path_factory).create_playbook()
     playbook.create_default_playbook()
@@ -56,7 +61,7 @@ def get_script(request: FixtureRequest, tmp_path_factory: TempPathFactory):
 
 
 @pytest.fixture
-def pack(request: FixtureRequest, tmp_path_factory: TempPathFactory) -> Pack:
+def pack(request: FixtureRequest, tmp_path_factory: TempPathFactory) -> "Pack":
     """Mocking tmp_path"""
     return get_pack(request, tmp_path_factory)
 
@@ -69,19 +74,19 @@ def script(request: FixtureRequest, tmp_path_factory: TempPathFactory):
 @pytest.fixture
 def integration(
     request: FixtureRequest, tmp_path_factory: TempPathFactory
-) -> Integration:
+) -> "Integration":
     """Mocking tmp_path"""
     return get_integration(request, tmp_path_factory)
 
 
 @pytest.fixture
-def repo(request: FixtureRequest, tmp_path_factory: TempPathFactory) -> Repo:
+def repo(request: FixtureRequest, tmp_path_factory: TempPathFactory) -> "Repo":
     """Mocking tmp_path"""
     return get_repo(request, tmp_path_factory)
 
 
 @pytest.fixture(scope="module")
-def module_repo(request: FixtureRequest, tmp_path_factory: TempPathFactory) -> Repo:
+def module_repo(request: FixtureRequest, tmp_path_factory: TempPathFactory) -> "Repo":
     from demisto_sdk.commands.find_dependencies.tests.find_dependencies_test import (
         working_repo,
     )
@@ -89,14 +94,34 @@ def module_repo(request: FixtureRequest, tmp_path_factory: TempPathFactory) -> R
     return working_repo(get_repo(request, tmp_path_factory))
 
 
+@pytest.fixture(scope="module")
+def module_pack(request: FixtureRequest, tmp_path_factory: TempPathFactory) -> "Pack":
+    """
+    A pack shared by all the tests of a module.
+    Use only in tests that do not rely on the pack content created by other tests, otherwise use `pack`.
+    """
+    return get_pack(request, tmp_path_factory)
+
+
+@pytest.fixture(scope="module")
+def module_integration(
+    request: FixtureRequest, tmp_path_factory: TempPathFactory
+) -> "Integration":
+    """
+    A default integration shared by all the tests of a module.
+    Use only in tests that do not modify the integration, otherwise use `integration`.
+    """
+    return get_integration(request, tmp_path_factory)
+
+
 @pytest.fixture
-def playbook(request: FixtureRequest, tmp_path_factory: TempPathFactory) -> Playbook:
+def playbook(request: FixtureRequest, tmp_path_factory: TempPathFactory) -> "Playbook":
     """Mocking tmp_path"""
     return get_playbook(request, tmp_path_factory)
 
 
 @pytest.fixture()
-def malformed_integration_yml(integration) -> YAML:
+def malformed_integration_yml(integration) -> "YAML":
     """
     Provides an invalid integration yml structure.
     """
@@ -105,7 +130,7 @@ def malformed_integration_yml(integration) -> YAML:
 
 
 @pytest.fixture()
-def malformed_incident_field(pack) -> JSONBased:
+def malformed_incident_field(pack) -> "JSONBased":
     """
     Provides an invalid incident field json structure.
     """
@@ -126,6 +151,26 @@ def mock_update_id_set_cpu_count() -> Generator:
         yield _fixture
 
 
+@pytest.fixture
+def fresh_file_cache():
+    """
+    Clears the `get_file` cache.
+    Use in tests that rewrite files which may have been read (and cached) by a previous test.
+    """
+    from demisto_sdk.commands.common.tools import get_file
+
+    get_file.cache_clear()
+
+
 @pytest.fixture(autouse=True)
-def clear_cache():
-    tools.get_file.cache_clear()
+def clear_pending_conf_json_updates() -> Generator:
+    """
+    Drops the conf.json updates a test left unflushed, so they are not read or written by later tests.
+    """
+    yield
+    # not imported here, so only tests that loaded the format module pay for it
+    update_generic_yml = sys.modules.get(
+        "demisto_sdk.commands.format.update_generic_yml"
+    )
+    if update_generic_yml:
+        update_generic_yml.CONF_JSON_PENDING_UPDATES.clear()
@@ -1262,6 +1262,11 @@ def coverage_analyze(ctx, **kwargs):
     help="Set if you want to deprecate the integration/script/playbook",
     is_flag=True,
 )
+@click.option(
+    "--deprecate-replacement",
+    help="The display name of the entity replacing the deprecated one. "
+    "Used with --deprecate instead of prompting for it.",
+)
 @click.option(
     "-g",
     "--use-git",
@@ -1308,6 +1313,7 @@ def format(
     update_docker: bool,
     assume_yes: Union[None, bool],
     deprecate: bool,
+    deprecate_replacement: Optional[str],
     use_git: bool,
     prev_ver: str,
     include_untracked: bool,
@@ -1338,6 +1344,7 @@ def format(
             update_docker=update_docker,
             assume_answer=assume_yes,
             deprecate=deprecate,
+            deprecate_replacement=deprecate_replacement,
             use_git=use_git,
             prev_ver=prev_ver,
             include_untracked=include_untracked,
@@ -8,19 +8,19 @@ def get_trigger(pack, name):
     )
 
 
-def test_objects_factory(pack):
-    trigger = get_trigger(pack, "trigger_name")
+def test_objects_factory(module_pack):
+    trigger = get_trigger(module_pack, "trigger_name")
     obj = path_to_pack_object(trigger.trigger_tmp_path)
     assert isinstance(obj, Trigger)
 
 
-def test_prefix(pack):
-    trigger = get_trigger(pack, "external-trigger-trigger_name")
+def test_prefix(module_pack):
+    trigger = get_trigger(module_pack, "external-trigger-trigger_name")
 
     obj = Trigger(trigger.trigger_tmp_path)
     assert obj.normalize_file_name() == trigger.trigger_tmp_path.name
 
-    trigger = get_trigger(pack, "trigger_name")
+    trigger = get_trigger(module_pack, "trigger_name")
 
     obj = Trigger(trigger.trigger_tmp_path)
     assert (
@@ -13,21 +13,21 @@ def get_xsiam_dashboard(pack, name):
     )
 
 
-def test_objects_factory(pack):
-    xsiam_dashboard = get_xsiam_dashboard(pack, "xsiam_dashboard_name")
+def test_objects_factory(module_pack):
+    xsiam_dashboard = get_xsiam_dashboard(module_pack, "xsiam_dashboard_name")
     obj = path_to_pack_object(xsiam_dashboard.xsiam_dashboard_tmp_path)
     assert isinstance(obj, XSIAMDashboard)
 
 
-def test_prefix(pack):
+def test_prefix(module_pack):
     xsiam_dashboard = get_xsiam_dashboard(
-        pack, "external-xsiamdashboard-xsiam_dashboard_name"
+        module_pack, "external-xsiamdashboard-xsiam_dashboard_name"
     )
 
     obj = XSIAMDashboard(xsiam_dashboard.xsiam_dashboard_tmp_path)
     assert obj.normalize_file_name() == xsiam_dashboard.xsiam_dashboard_tmp_path.name
 
-    xsiam_dashboard = get_xsiam_dashboard(pack, "xsiam_dashboard_name")
+    xsiam_dashboard = get_xsiam_dashboard(module_pack, "xsiam_dashboard_name")
 
     obj = XSIAMDashboard(xsiam_dashboard.xsiam_dashboard_tmp_path)
     assert (
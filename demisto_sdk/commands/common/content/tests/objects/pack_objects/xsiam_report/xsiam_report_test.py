@@ -13,19 +13,21 @@ def get_xsiam_report(pack, name):
     )
 
 
-def test_objects_factory(pack):
-    xsiam_report = get_xsiam_report(pack, "xsiam_report_name")
+def test_objects_factory(module_pack):
+    xsiam_report = get_xsiam_report(module_pack, "xsiam_report_name")
     obj = path_to_pack_object(xsiam_report.xsiam_report_tmp_path)
     assert isinstance(obj, XSIAMReport)
 
 
-def test_prefix(pack):
-    xsiam_report = get_xsiam_report(pack, "external-xsiamreport-xsiam_report_name")
+def test_prefix(module_pack):
+    xsiam_report = get_xsiam_report(
+        module_pack, "external-xsiamreport-xsiam_report_name"
+    )
 
     obj = XSIAMReport(xsiam_report.xsiam_report_tmp_path)
     assert obj.normalize_file_name() == xsiam_report.xsiam_report_tmp_path.name
 
-    xsiam_report = get_xsiam_report(pack, "xsiam_report_name")
+    xsiam_report = get_xsiam_report(module_pack, "xsiam_report_name")
 
     obj = XSIAMReport(xsiam_report.xsiam_report_tmp_path)
     assert (
@@ -31,8 +31,8 @@ class OrJSON_Handler(XSOAR_Handler):
     def _indent_level(indent: Optional[int] = None):
         if indent == 4:
             return orjson.OPT_INDENT_2
-        return None
+        return 0
 
     @staticmethod
     def _sort_keys(sort_keys: bool):
-        return orjson.OPT_SORT_KEYS if sort_keys else None
+        return orjson.OPT_SORT_KEYS if sort_keys else 0
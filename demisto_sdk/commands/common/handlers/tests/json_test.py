@@ -1,6 +1,6 @@
 import pytest
 
-from demisto_sdk.commands.common.handlers import JSON_Handler
+from demisto_sdk.commands.common.handlers import JSON_Handler, OrJSON_Handler
 
 
 class TestJSONHandler:
@@ -22,3 +22,14 @@ class TestJSONHandler:
         url = f"https:{slashes}xsoar.com"
         JSON_Handler().dump({"url": url}, file_.open("w+"))
         assert url in file_.open().read()
+
+
+class TestOrJSONHandler:
+    def test_dumps_without_options(self):
+        """Check that dumping with the default arguments returns compact bytes"""
+        assert OrJSON_Handler().dumps({"a": 1}) == b'{"a":1}'
+
+    def test_dumps_with_indent_and_sort_keys(self):
+        """Check that indent=4 and sort_keys are translated to orjson options"""
+        dumped = OrJSON_Handler().dumps({"b": 1, "a": 2}, indent=4, sort_keys=True)
+        assert dumped == b'{\n  "a": 2,\n  "b": 1\n}'
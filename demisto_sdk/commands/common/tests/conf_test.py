@@ -274,8 +274,8 @@ def test_has_unittests(mocker, integration, has_tests):
     assert res == has_tests
 
 
-def test_get_test_path(mocker, integration):
+def test_get_test_path(mocker, module_integration):
     mocker.patch.object(ConfJsonValidator, "load_conf_file", return_value={})
     validator = ConfJsonValidator()
-    res = validator.get_test_path(integration.yml.path)
-    assert res.parts[-1] == integration.name + "_test.py"
+    res = validator.get_test_path(module_integration.yml.path)
+    assert res.parts[-1] == module_integration.name + "_test.py"
@@ -124,6 +124,7 @@ class TestLayoutSixConverter:
     @pytest.mark.parametrize(
         "old_layout_path, expected", CALCULATE_NEW_LAYOUT_GROUP_INPUTS
     )
+    @pytest.mark.usefixtures("fresh_file_cache")
     def test_calculate_new_layout_group(
         self, tmpdir, old_layout_path: str, expected: str
     ):
@@ -308,6 +308,7 @@ def test_create_private_content_artifacts(private_repo):
         assert exit_code == 0
 
 
+@pytest.mark.usefixtures("fresh_file_cache")
 @pytest.mark.parametrize(argnames="suffix", argvalues=["yml", "json"])
 def test_malformed_file_failure(suffix: str, mock_git):
     from demisto_sdk.commands.create_artifacts.content_artifacts_creator import (
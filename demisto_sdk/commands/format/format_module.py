@@ -1,6 +1,6 @@
 import os
 from pathlib import Path
-from typing import Dict, List, Tuple, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 from demisto_sdk.commands.common.constants import (
     JOB,
@@ -139,6 +139,7 @@ def format_manager(
     id_set_path: str = None,
     clear_cache: bool = False,
     use_graph: bool = True,
+    deprecate_replacement: Optional[str] = None,
 ):
     """
     Format_manager is a function that activated format command on different type of files.
@@ -158,6 +159,7 @@ def format_manager(
         id_set_path (str): The path of the id_set.json file.
         clear_cache (bool): wether to clear the cache
         use_graph (bool): wheter to use the graph in format
+        deprecate_replacement (str): The display name of the replacing entity, used instead of prompting for it when deprecating
     Returns:
         int 0 in case of success 1 otherwise
     """
@@ -209,61 +211,66 @@ def format_manager(
                 use_git=True,
                 output_path=graph.output_path,
             )
-        for file in files:
-            file_path = str(Path(file))
-            file_type = find_type(file_path, clear_cache=clear_cache)
-
-            # Check if this is an unskippable file
-            if not any(
-                [
-                    file_path.endswith(unskippable_file)
-                    for unskippable_file in UNSKIP_FORMATTING_FILES
-                ]
-            ):
-                # If it is not an unskippable file, skip if needed
-                if Path(file_path).name in SKIP_FORMATTING_FILES:
-                    continue
-
-            if file_type and file_type.value not in UNFORMATTED_FILES:
-                file_type = file_type.value
-                info_res, err_res, skip_res = run_format_on_file(
-                    input=file_path,
-                    file_type=file_type,
-                    from_version=from_version,
-                    interactive=interactive,
-                    output=output,
-                    no_validate=no_validate,
-                    update_docker=update_docker,
-                    assume_answer=assume_answer,
-                    deprecate=deprecate,
-                    add_tests=add_tests,
-                    graph=graph,
-                )
-                if err_res:
-                    log_list.extend([(err_res, "red")])
-                if info_res:
-                    log_list.extend([(info_res, "green")])
-                if skip_res:
-                    log_list.extend([(skip_res, "yellow")])
-            elif file_type:
-                log_list.append(
-                    (
-                        [
-                            f"Ignoring format for {file_path} as {file_type.value} is currently not "
-                            f"supported by format command"
-                        ],
-                        "yellow",
+        try:
+            for file in files:
+                file_path = str(Path(file))
+                file_type = find_type(file_path, clear_cache=clear_cache)
+
+                # Check if this is an unskippable file
+                if not any(
+                    [
+                        file_path.endswith(unskippable_file)
+                        for unskippable_file in UNSKIP_FORMATTING_FILES
+                    ]
+                ):
+                    # If it is not an unskippable file, skip if needed
+                    if Path(file_path).name in SKIP_FORMATTING_FILES:
+                        continue
+
+                if file_type and file_type.value not in UNFORMATTED_FILES:
+                    file_type = file_type.value
+                    info_res, err_res, skip_res = run_format_on_file(
+                        input=file_path,
+                        file_type=file_type,
+                        from_version=from_version,
+                        interactive=interactive,
+                        output=output,
+                        no_validate=no_validate,
+                        update_docker=update_docker,
+                        assume_answer=assume_answer,
+                        deprecate=deprecate,
+                        deprecate_replacement=deprecate_replacement,
+                        add_tests=add_tests,
+                        graph=graph,
                     )
-                )
-            else:
-                log_list.append(
-                    (
-                        [
-                            f"Was unable to identify the file type for the following file: {file_path}"
-                        ],
-                        "red",
+                    if err_res:
+                        log_list.extend([(err_res, "red")])
+                    if info_res:
+                        log_list.extend([(info_res, "green")])
+                    if skip_res:
+                        log_list.extend([(skip_res, "yellow")])
+                elif file_type:
+                    log_list.append(
+                        (
+                            [
+                                f"Ignoring format for {file_path} as {file_type.value} is currently not "
+                                f"supported by format command"
+                            ],
+                            "yellow",
+                        )
                     )
-                )
+                else:
+                    log_list.append(
+                        (
+                            [
+                                f"Was unable to identify the file type for the following file: {file_path}"
+                            ],
+                            "red",
+                        )
+                    )
+        finally:
+            # write the conf.json updates of the files formatted so far, even if formatting a file failed
+            BaseUpdateYML.flush_conf_json()
         if (
             graph
         ):  # In case that the graph was activated, we need to call exit in order to close it.
@@ -1,4 +1,8 @@
+import pytest
+
+from demisto_sdk.commands.common.tools import get_json
 from demisto_sdk.commands.format.format_module import format_manager
+from demisto_sdk.commands.format.update_generic_yml import CONF_JSON_PENDING_UPDATES
 from TestSuite.test_tools import ChangeCWD
 
 
@@ -29,3 +33,30 @@ def test_format_venv_in_dir(mocker, repo):
     assert format_file_call.called
     for call_args in format_file_call.call_args_list:
         assert ".venv" not in call_args.kwargs["input"]
+
+
+def test_format_flushes_conf_json_when_a_file_fails(mocker, repo):
+    """
+    Given:
+        - A conf.json update accepted while formatting a previous file
+    When:
+        - Running format, and formatting a file raises
+    Then:
+        - Ensure the pending conf.json update is still written
+    """
+    pack = repo.create_pack("SomePack1")
+    pack.create_integration(name="SomeIntegration")
+    conf_path = str(repo.conf.path)
+    CONF_JSON_PENDING_UPDATES[conf_path] = {"tests": [{"playbookID": "new_test"}]}
+    mocker.patch(
+        "demisto_sdk.commands.format.format_module.run_format_on_file",
+        side_effect=Exception("formatting failed"),
+    )
+
+    with ChangeCWD(repo.path), pytest.raises(Exception, match="formatting failed"):
+        format_manager(input=str(pack._pack_path), use_graph=False)
+
+    assert not CONF_JSON_PENDING_UPDATES
+    assert get_json(conf_path, cache_clear=True)["tests"] == [
+        {"playbookID": "new_test"}
+    ]
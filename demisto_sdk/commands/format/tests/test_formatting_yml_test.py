@@ -24,10 +24,13 @@ from demisto_sdk.commands.common.hook_validations.integration import (
     IntegrationValidator,
 )
 from demisto_sdk.commands.common.legacy_git_tools import git_path
-from demisto_sdk.commands.common.tools import get_yaml, is_string_uuid
+from demisto_sdk.commands.common.tools import get_file, get_yaml, is_string_uuid
 from demisto_sdk.commands.format.format_module import format_manager
 from demisto_sdk.commands.format.update_generic import BaseUpdate
-from demisto_sdk.commands.format.update_generic_yml import BaseUpdateYML
+from demisto_sdk.commands.format.update_generic_yml import (
+    BaseUpdateYML,
+    _atomic_write_bytes,
+)
 from demisto_sdk.commands.format.update_integration import IntegrationYMLFormat
 from demisto_sdk.commands.format.update_playbook import (
     PlaybookYMLFormat,
@@ -1531,6 +1534,44 @@ class TestFormatting:
         assert base_update_yml.data["tests"] == [NO_TESTS_DEPRECATED]
         assert base_update_yml.data["description"] == description_result
 
+    @pytest.mark.parametrize(
+        "assume_answer, deprecate_replacement, description_result",
+        [
+            (True, None, "Deprecated. No available replacement."),
+            (False, None, "Deprecated. No available replacement."),
+            (None, "Replacement entity", "Deprecated. Use Replacement entity instead."),
+        ],
+    )
+    def test_update_deprecate_non_interactive(
+        self, pack, mocker, assume_answer, deprecate_replacement, description_result
+    ):
+        """
+        Given
+            - An integration yml to deprecate.
+            - Either an assumed answer or a replacement entity given in advance.
+        When
+            - Running update_deprecate.
+        Then
+            - Ensure the user is not prompted for a replacement entity.
+            - Ensure the description is set according to the given replacement.
+        """
+        integration = pack.create_integration("my_integration")
+        input_mock = mocker.patch("builtins.input")
+        mocker.patch.object(
+            BaseUpdateYML, "get_id_and_version_path_object", return_value={}
+        )
+        base_update_yml = BaseUpdateYML(
+            input=integration.yml.path,
+            deprecate=True,
+            assume_answer=assume_answer,
+            deprecate_replacement=deprecate_replacement,
+        )
+        base_update_yml.update_deprecate(file_type="integration")
+
+        assert not input_mock.called
+        assert base_update_yml.data["deprecated"]
+        assert base_update_yml.data["description"] == description_result
+
     @pytest.mark.parametrize(
         "user_input, description_result",
         [
@@ -1943,6 +1984,7 @@ def test_yml_run_format_exception_handling(format_object, mocker):
     )
 
 
+@pytest.mark.usefixtures("fresh_file_cache")
 def test_handle_hidden_marketplace_params():
     """
     Given
@@ -1964,3 +2006,108 @@ def test_handle_hidden_marketplace_params():
     assert base_yml.old_file["configuration"][7]["hidden"] == ["marketplacev2"]
     assert base_yml.data["configuration"][6]["hidden"] == ["marketplacev2"]
     assert base_yml.data["configuration"][7]["hidden"] == ["marketplacev2"]
+
+
+def test_load_conf_file_reloads_after_modification(tmp_path, monkeypatch):
+    """
+    Given
+    - A conf.json file that was already loaded by the formatter.
+    When
+    - Loading it again before and after it was rewritten on disk.
+    Then
+    - Ensure the parsed content is reused while the file is unchanged, and reloaded after it was modified.
+    """
+    conf_json_path = tmp_path / "conf.json"
+    monkeypatch.setattr(
+        "demisto_sdk.commands.format.update_generic_yml.CONF_PATH", conf_json_path
+    )
+    conf_json_path.write_text('{"tests": []}')
+    base_yml = IntegrationYMLFormat(SOURCE_FORMAT_INTEGRATION_VALID, path="schema_path")
+
+    first_load = base_yml._load_conf_file()
+    assert first_load == {"tests": []}
+    assert base_yml._load_conf_file() is first_load
+
+    conf_json_path.write_text('{"tests": [{"playbookID": "test"}]}')
+    stat = conf_json_path.stat()
+    os.utime(conf_json_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    assert base_yml._load_conf_file() == {"tests": [{"playbookID": "test"}]}
+
+
+def test_conf_json_updates_are_written_once_flushed(tmp_path, monkeypatch):
+    """
+    Given
+    - An integration with a test playbook which is not registered in conf.json.
+    When
+    - Running update_conf_json, and then flush_conf_json.
+    Then
+    - Ensure conf.json is written only when flushed, while the pending update is already visible to the formatter.
+    """
+    conf_json_path = tmp_path / "conf.json"
+    monkeypatch.setattr(
+        "demisto_sdk.commands.format.update_generic_yml.CONF_PATH", conf_json_path
+    )
+    conf_json_path.write_text('{"tests": []}')
+    base_yml = IntegrationYMLFormat(
+        SOURCE_FORMAT_INTEGRATION_VALID, path="schema_path", assume_answer=True
+    )
+    base_yml.data["tests"] = ["test_playbook"]
+
+    base_yml.update_conf_json("integration")
+    expected_test_configuration = {
+        "integrations": base_yml.data["commonfields"]["id"],
+        "playbookID": "test_playbook",
+    }
+    assert base_yml._load_conf_file()["tests"] == [expected_test_configuration]
+    assert conf_json_path.read_text() == '{"tests": []}'
+
+    BaseUpdateYML.flush_conf_json()
+    assert get_file(conf_json_path, clear_cache=True) == {
+        "tests": [expected_test_configuration]
+    }
+
+
+def test_atomic_write_keeps_mode_and_symlink(tmp_path):
+    """
+    Given
+    - An executable file, and a symlink to it.
+    When
+    - Atomically writing new content through the symlink.
+    Then
+    - Ensure the symlink still points to the file, which has the new content and its original mode.
+    """
+    target = tmp_path / "file.yml"
+    target.write_text("old")
+    target.chmod(0o755)
+    link = tmp_path / "link.yml"
+    link.symlink_to(target)
+
+    _atomic_write_bytes(link, b"new")
+
+    assert link.is_symlink()
+    assert target.read_text() == "new"
+    assert target.stat().st_mode & 0o777 == 0o755
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["file.yml", "link.yml"]
+
+
+def test_atomic_write_removes_temp_file_on_failure(tmp_path, mocker):
+    """
+    Given
+    - A file to write.
+    When
+    - Replacing the file with the written temporary file fails.
+    Then
+    - Ensure the original file is untouched and no temporary file is left behind.
+    """
+    target = tmp_path / "file.yml"
+    target.write_text("old")
+    mocker.patch(
+        "demisto_sdk.commands.format.update_generic_yml.os.replace",
+        side_effect=OSError("No space left on device"),
+    )
+
+    with pytest.raises(OSError):
+        _atomic_write_bytes(target, b"new")
+
+    assert target.read_text() == "old"
+    assert [path.name for path in tmp_path.iterdir()] == ["file.yml"]
@@ -396,18 +396,9 @@ class BaseUpdate:
         When developer clones playbook/integration/script it will automatically add _copy or _dev suffix.
         """
         logger.info("Removing _dev and _copy suffixes from name, id and display tags")
-        if self.data["name"]:
-            self.data["name"] = (
-                self.data.get("name", "").replace("_copy", "").replace("_dev", "")
-            )
-        if self.data.get("display"):
-            self.data["display"] = (
-                self.data.get("display", "").replace("_copy", "").replace("_dev", "")
-            )
-        if self.data.get("id"):
-            self.data["id"] = (
-                self.data.get("id", "").replace("_copy", "").replace("_dev", "")
-            )
+        for key in ("name", "display", "id"):
+            if value := self.data.get(key):
+                self.data[key] = value.replace("_copy", "").replace("_dev", "")
 
     def initiate_file_validator(self) -> int:
         """Run schema validate and file validate of file
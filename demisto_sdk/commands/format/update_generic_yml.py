@@ -1,5 +1,10 @@
 import os
+import re
+import shutil
 import traceback
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
 from typing import Dict, List, Optional, Tuple, Union
 
 import click
@@ -27,7 +32,6 @@ from demisto_sdk.commands.common.tools import (
     get_scripts_and_commands_from_yml_data,
     get_yaml,
     is_uuid,
-    listdir_fullpath,
     search_and_delete_from_conf,
 )
 from demisto_sdk.commands.format.format_constants import (
@@ -37,6 +41,39 @@ from demisto_sdk.commands.format.format_constants import (
 )
 from demisto_sdk.commands.format.update_generic import BaseUpdate
 
+NO_TESTS_PATTERN = re.compile("no test", flags=re.IGNORECASE)
+
+# conf.json contents modified during the format run, by path, written once by `BaseUpdateYML.flush_conf_json`
+CONF_JSON_PENDING_UPDATES: Dict[str, Dict] = {}
+
+
+def _atomic_write_bytes(path: Union[str, Path], content: bytes) -> None:
+    """
+    Writes the content to a temporary file next to `path` and then replaces `path` with it,
+    so an interrupted write never leaves a truncated file behind.
+    A symlinked `path` keeps being a symlink (its target is the one replaced), and the file mode is kept.
+    """
+    target = Path(os.path.realpath(path))
+    tmp_path = target.with_name(f"{target.name}.tmp")
+    try:
+        tmp_path.write_bytes(content)
+        if target.exists():
+            shutil.copymode(target, tmp_path)
+        os.replace(tmp_path, target)
+    finally:
+        # only left behind when the write or replace failed
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+
+@lru_cache(maxsize=4)
+def _load_conf_cached(path: str, mtime_ns: int) -> Dict:
+    """
+    Loads conf.json, cached by the file modification time so rewrites of the file are picked up.
+    Bypasses the path-keyed cache of `get_file`, which is not aware of changes on disk.
+    """
+    return get_file.__wrapped__(path, raise_on_error=True)
+
 
 class BaseUpdateYML(BaseUpdate):
     """BaseUpdateYML is the base class for all yml updaters.
@@ -48,12 +85,14 @@ class BaseUpdateYML(BaseUpdate):
         id_and_version_location (Dict): the object in the yml_data that holds the id and version values.
     """
 
-    ID_AND_VERSION_PATH_BY_YML_TYPE = {
-        "IntegrationYMLFormat": "commonfields",
-        "ScriptYMLFormat": "commonfields",
-        "PlaybookYMLFormat": "",
-        "TestPlaybookYMLFormat": "",
-    }
+    ID_AND_VERSION_PATH_BY_YML_TYPE = MappingProxyType(
+        {
+            "IntegrationYMLFormat": "commonfields",
+            "ScriptYMLFormat": "commonfields",
+            "PlaybookYMLFormat": "",
+            "TestPlaybookYMLFormat": "",
+        }
+    )
 
     def __init__(
         self,
@@ -67,6 +106,7 @@ class BaseUpdateYML(BaseUpdate):
         add_tests: bool = True,
         interactive: bool = True,
         clear_cache: bool = False,
+        deprecate_replacement: Optional[str] = None,
     ):
         super().__init__(
             input=input,
@@ -80,15 +120,22 @@ class BaseUpdateYML(BaseUpdate):
         )
         self.id_and_version_location = self.get_id_and_version_path_object()
         self.deprecate = deprecate
+        self.deprecate_replacement = deprecate_replacement
         self.add_tests = add_tests
+        # two levels up from the yml, e.g. Packs/MyPack for Packs/MyPack/Playbooks/MyPlaybook.yml
+        self._pack_path = Path(os.path.abspath(self.source_file or "")).parent.parent
 
     def _load_conf_file(self) -> Dict:
         """
         Loads the content of conf.json file from path 'CONF_PATH'
         Returns:
-            The content of the json file
+            The content of the json file, including updates not yet written to it
         """
-        return get_file(CONF_PATH, raise_on_error=True)
+        if (
+            pending_update := CONF_JSON_PENDING_UPDATES.get(str(CONF_PATH))
+        ) is not None:
+            return pending_update
+        return _load_conf_cached(str(CONF_PATH), os.stat(CONF_PATH).st_mtime_ns)
 
     def get_id_and_version_path_object(self):
         """Gets the dict that holds the id and version fields.
@@ -98,13 +145,12 @@ class BaseUpdateYML(BaseUpdate):
         return self.get_id_and_version_for_data(self.data)
 
     def get_id_and_version_for_data(self, data):
-        yml_type = self.__class__.__name__
-        try:
-            path = self.ID_AND_VERSION_PATH_BY_YML_TYPE[yml_type]
-            return data.get(path, data)
-        except KeyError:
+        path = self.ID_AND_VERSION_PATH_BY_YML_TYPE.get(self.__class__.__name__)
+        if path is None:
             # content type is not relevant for checks using this property
             return None
+        # playbooks keep the id and version at the top level
+        return data.get(path, data) if path else data
 
     def update_id_to_equal_name(self) -> None:
         """Updates the id of the YML to be the same as it's name
@@ -134,8 +180,9 @@ class BaseUpdateYML(BaseUpdate):
         """Safely saves formatted YML data to destination file."""
         if self.source_file != self.output_file:
             logger.debug(f"Saving output YML file to {self.output_file} \n")
-        with open(self.output_file, "w") as f:
-            yaml.dump(self.data, f)  # ruamel preservers multilines
+        _atomic_write_bytes(
+            self.output_file, yaml.dumps(self.data).encode("utf-8")
+        )  # ruamel preservers multilines
 
     def copy_tests_from_old_file(self):
         """Copy the tests key from old file if exists."""
@@ -180,10 +227,7 @@ class BaseUpdateYML(BaseUpdate):
         """
         if not self.data.get("tests", ""):
             # try to get the test playbook files from the TestPlaybooks dir in the pack
-            pack_path = os.path.dirname(
-                os.path.dirname(os.path.abspath(self.source_file))
-            )
-            test_playbook_dir_path = os.path.join(pack_path, TEST_PLAYBOOKS_DIR)
+            test_playbook_dir_path = self._pack_path / TEST_PLAYBOOKS_DIR
             test_playbook_ids = []
             file_entity_type = find_type(
                 self.source_file, _dict=self.data, file_type="yml"
@@ -194,18 +238,30 @@ class BaseUpdateYML(BaseUpdate):
             commands, scripts = get_scripts_and_commands_from_yml_data(
                 self.data, file_entity_type
             )
-            commands_names = [command.get("id") for command in commands]
+            # reversed so the first command with a given name wins, as with list.index
+            commands_by_name = {
+                command.get("id"): command for command in reversed(commands)
+            }
+            scripts_set = set(scripts)
             try:
-                # Collecting the test playbooks
-                test_playbooks_files = [
-                    tpb_file
-                    for tpb_file in listdir_fullpath(test_playbook_dir_path)
-                    if find_type(tpb_file) == FileType.TEST_PLAYBOOK
-                ]
+                # Collecting the test playbooks, loading each yml once for both the type check and the matching
+                test_playbooks_data = []
+                with os.scandir(test_playbook_dir_path) as entries:
+                    tpb_files = [
+                        entry.path
+                        for entry in entries
+                        if entry.name.endswith(".yml") and entry.is_file()
+                    ]
+                for tpb_file in tpb_files:
+                    tpb_data = get_yaml(tpb_file)
+                    if (
+                        find_type(tpb_file, _dict=tpb_data, file_type="yml")
+                        == FileType.TEST_PLAYBOOK
+                    ):
+                        test_playbooks_data.append(tpb_data)
                 for (
-                    tpb_file_path
-                ) in test_playbooks_files:  # iterate over the test playbooks in the dir
-                    test_playbook_data = get_yaml(tpb_file_path)
+                    test_playbook_data
+                ) in test_playbooks_data:  # iterate over the test playbooks in the dir
                     test_playbook_id = get_entity_id_by_entity_type(
                         test_playbook_data, content_entity=""
                     )
@@ -230,10 +286,9 @@ class BaseUpdateYML(BaseUpdate):
                             ):
                                 continue
 
-                            if not added and tpb_command_name in commands_names:
-                                command_source = commands[
-                                    commands_names.index(tpb_command_name)
-                                ].get("source", "")
+                            command = commands_by_name.get(tpb_command_name)
+                            if not added and command is not None:
+                                command_source = command.get("source", "")
                                 if (
                                     command_source == tpb_command_source
                                     or command_source == ""
@@ -244,7 +299,7 @@ class BaseUpdateYML(BaseUpdate):
 
                         if not added:
                             for tpb_script in tpb_scripts:
-                                if tpb_script in scripts:
+                                if tpb_script in scripts_set:
                                     test_playbook_ids.append(test_playbook_id)
                                     break
 
@@ -278,9 +333,7 @@ class BaseUpdateYML(BaseUpdate):
         """
         related_test_playbook = self.data.get("tests", [])
         no_test_playbooks_explicitly = any(
-            test
-            for test in related_test_playbook
-            if ("no test" in test.lower()) or ("no tests" in test.lower())
+            NO_TESTS_PATTERN.search(test) for test in related_test_playbook
         )
         try:
             conf_json_content = self._load_conf_file()
@@ -309,10 +362,7 @@ class BaseUpdateYML(BaseUpdate):
         test_playbooks = self.data.get("tests", [])
         if not test_playbooks:
             return
-        no_test_playbooks_explicitly = any(
-            test for test in test_playbooks if "no test" in test.lower()
-        )
-        if no_test_playbooks_explicitly:
+        if any(NO_TESTS_PATTERN.search(test) for test in test_playbooks):
             return
         try:
             conf_json_content = self._load_conf_file()
@@ -352,9 +402,24 @@ class BaseUpdateYML(BaseUpdate):
             logger.debug("No unconfigured test playbooks")
 
     def _save_to_conf_json(self, conf_json_content: Dict) -> None:
-        """Save formatted JSON data to destination file."""
-        with open(CONF_PATH, "w") as file:
-            json.dump(conf_json_content, file, indent=4)
+        """Marks the conf.json content to be saved, the file is written once by `flush_conf_json`."""
+        CONF_JSON_PENDING_UPDATES[str(CONF_PATH)] = conf_json_content
+
+    @staticmethod
+    def flush_conf_json() -> None:
+        """Writes the conf.json updates collected during the format run."""
+        for conf_path, conf_json_content in CONF_JSON_PENDING_UPDATES.items():
+            logger.debug(f"Saving the updated {conf_path}")
+            _atomic_write_bytes(
+                conf_path, json.dumps(conf_json_content, indent=4).encode("utf-8")
+            )
+        CONF_JSON_PENDING_UPDATES.clear()
+
+    def initiate_file_validator(self) -> int:
+        """Writes the pending conf.json updates before validating, as the validation reads conf.json"""
+        if not self.no_validate:
+            self.flush_conf_json()
+        return super().initiate_file_validator()
 
     def update_deprecate(self, file_type=None):
         """
@@ -385,9 +450,15 @@ class BaseUpdateYML(BaseUpdate):
         else:
             description_field = "comment"
 
-        user_response = input(
-            "\nPlease enter the replacement entity display name if any and press Enter if not.\n"
-        )
+        if self.deprecate_replacement is not None:
+            user_response = self.deprecate_replacement
+        elif self.assume_answer is not None:
+            # running non-interactively, there is no one to ask for a replacement
+            user_response = ""
+        else:
+            user_response = input(
+                "\nPlease enter the replacement entity display name if any and press Enter if not.\n"
+            )
 
         if user_response:
             self.data[description_field] = f"Deprecated. Use {user_response} instead."
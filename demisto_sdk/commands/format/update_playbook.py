@@ -1,6 +1,6 @@
 import os
 import uuid
-from typing import Tuple, Union
+from typing import Optional, Tuple, Union
 
 from git import InvalidGitRepositoryError
 
@@ -40,6 +40,7 @@ class BasePlaybookYMLFormat(BaseUpdateYML):
         add_tests: bool = False,
         interactive: bool = True,
         clear_cache: bool = False,
+        deprecate_replacement: Optional[str] = None,
         **kwargs,
     ):
         super().__init__(
@@ -53,6 +54,7 @@ class BasePlaybookYMLFormat(BaseUpdateYML):
             add_tests=add_tests,
             interactive=interactive,
             clear_cache=clear_cache,
+            deprecate_replacement=deprecate_replacement,
         )
 
     def add_description(self):
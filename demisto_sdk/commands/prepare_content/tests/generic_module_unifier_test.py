@@ -18,6 +18,9 @@ from TestSuite.test_tools import (
     str_in_call_args_list,
 )
 
+# the tests create the same relative files in different repos, which are read through the `get_file` cache
+pytestmark = pytest.mark.usefixtures("fresh_file_cache")
+
 
 def test_find_dashboard_by_id_positive(repo):
     """
@@ -1264,6 +1264,7 @@ class TestRNUpdate:
             "%%% instead.\n"
         )
 
+    @pytest.mark.usefixtures("fresh_file_cache")
     def test_deprecated_rn_integration_command(self, mocker):
         """
         Given:
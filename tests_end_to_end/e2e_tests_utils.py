@@ -1,47 +1,246 @@
+import asyncio
+import logging
+import os
+import shlex
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple, Union
 
-import demisto_client
+# demisto_client and the demisto_sdk modules are imported where they are used, to keep this module cheap to import
+if TYPE_CHECKING:
+    from demisto_client.demisto_api import DefaultApi
 
-from demisto_sdk.commands.common.constants import DEMISTO_GIT_PRIMARY_BRANCH
-from demisto_sdk.commands.common.logger import logger
-from demisto_sdk.commands.common.tools import get_demisto_version
+# the demisto-sdk logger, without importing (and setting up) demisto_sdk.commands.common.logger
+logger = logging.getLogger("demisto-sdk")
+
+DEMISTO_SDK_REPO_URL = "https://github.com/demisto/demisto-sdk.git"
+
+# destination folders already added to sys.path
+_cloned_to: Set[str] = set()
 
 
 def git_clone_demisto_sdk(
-    destination_folder: str, sdk_git_branch: str = DEMISTO_GIT_PRIMARY_BRANCH
-):
-    """Clone demisto-sdk from GitHub and add it to sys.path"""
+    destination_folder: str,
+    sdk_git_branch: Optional[str] = None,
+    shared_repo: Optional[str] = None,
+) -> Path:
+    """
+    Clone demisto-sdk from GitHub (or update an existing clone) and add it to sys.path
+    sdk_git_branch defaults to DEMISTO_GIT_PRIMARY_BRANCH.
+    When shared_repo is given (e.g. a folder shared by the pytest-xdist workers), a single bare clone is kept there,
+    and destination_folder is a worktree of it, so the workers share one download and object store.
+    Returns the path of the clone.
+    """
+    if sdk_git_branch is None:
+        from demisto_sdk.commands.common.constants import DEMISTO_GIT_PRIMARY_BRANCH
+
+        sdk_git_branch = DEMISTO_GIT_PRIMARY_BRANCH
+
+    if shared_repo:
+        _add_shared_worktree(shared_repo, destination_folder, sdk_git_branch)
+    elif Path(destination_folder, ".git").is_dir():
+        _update_clone(destination_folder, sdk_git_branch)
+    else:
+        _clone(destination_folder, sdk_git_branch)
+
+    _add_to_sys_path(destination_folder)
+    return Path(destination_folder)
+
+
+def _clone(destination_folder: str, sdk_git_branch: str):
     from demisto_sdk.commands.common.git_util import GitUtil
 
     logger.info(f"Cloning demisto-sdk to {destination_folder}")
 
-    GitUtil.REPO_CLS.clone_from(
-        url="https://github.com/demisto/demisto-sdk.git",
+    # a partial clone without checkout, blobs are fetched only for the files checked out below.
+    # --sparse initializes the sparse-checkout as part of the clone, saving a `git sparse-checkout init` call
+    repo = GitUtil.REPO_CLS.clone_from(
+        url=DEMISTO_SDK_REPO_URL,
         to_path=destination_folder,
-        multi_options=[f"-b {sdk_git_branch}", "--single-branch", "--depth 1"],
+        multi_options=[
+            "--filter=blob:none",
+            "--no-checkout",
+            "--sparse",
+            "--depth=1",
+            f"--branch={sdk_git_branch}",
+            "--single-branch",
+        ],
     )
+    # TestSuite is the only package imported from the clone (demisto_sdk itself is installed)
+    repo.git.sparse_checkout("set", "TestSuite")
+    repo.git.checkout(sdk_git_branch)
+
+
+def _update_clone(destination_folder: str, sdk_git_branch: str):
+    from demisto_sdk.commands.common.git_util import GitUtil
+
+    repo = GitUtil.REPO_CLS(destination_folder)
+    repo.remotes.origin.fetch(
+        f"+refs/heads/{sdk_git_branch}:refs/remotes/origin/{sdk_git_branch}",
+        depth=1,
+    )
+    remote_commit = repo.remotes.origin.refs[sdk_git_branch].commit
+    if repo.head.commit != remote_commit:
+        logger.info(f"Updating the demisto-sdk clone in {destination_folder}")
+        repo.git.checkout("-B", sdk_git_branch, remote_commit.hexsha)
+
+
+def _add_shared_worktree(
+    shared_repo: str, destination_folder: str, sdk_git_branch: str
+):
+    from filelock import FileLock
+    from git import Git
+
+    from demisto_sdk.commands.common.git_util import GitUtil
+
+    # the bare repo and its worktrees list are shared, so only one worker may change them at a time
+    with FileLock(f"{shared_repo}.lock"):
+        if Path(shared_repo).is_dir():
+            # commands run directly in the bare repo, as once it has worktrees GitPython no longer detects it as bare
+            Git(shared_repo).fetch(
+                "--depth=1",
+                "origin",
+                f"+refs/heads/{sdk_git_branch}:refs/heads/{sdk_git_branch}",
+            )
+        else:
+            logger.info(f"Cloning demisto-sdk to {shared_repo}")
+            GitUtil.REPO_CLS.clone_from(
+                url=DEMISTO_SDK_REPO_URL,
+                to_path=shared_repo,
+                bare=True,
+                multi_options=[
+                    "--filter=blob:none",
+                    "--depth=1",
+                    f"--branch={sdk_git_branch}",
+                    "--single-branch",
+                ],
+            )
+
+        if Path(destination_folder, ".git").exists():
+            GitUtil.REPO_CLS(destination_folder).git.checkout(
+                "--detach", sdk_git_branch
+            )
+            return
+
+        logger.info(f"Adding a demisto-sdk worktree in {destination_folder}")
+        # detached, as a branch can be checked out by a single worktree only
+        Git(shared_repo).worktree(
+            "add", "--no-checkout", "--detach", destination_folder, sdk_git_branch
+        )
+        worktree = GitUtil.REPO_CLS(destination_folder)
+        worktree.git.sparse_checkout("set", "TestSuite")
+        worktree.git.checkout("--detach", sdk_git_branch)
+
 
-    sys.path.insert(1, f"{destination_folder}")
+def _add_to_sys_path(destination_folder: str):
+    if destination_folder not in _cloned_to:
+        sys.path.insert(1, f"{destination_folder}")
+        _cloned_to.add(destination_folder)
 
 
-def cli(command: str) -> subprocess.CompletedProcess:
-    if command:
-        run_req = str(command).split(" ")
-        ret_value: subprocess.CompletedProcess = subprocess.run(run_req)
-        ret_value.check_returncode()
-        return ret_value
-    raise Exception("cli cannot be empty.")
+@lru_cache(maxsize=256)
+def _split_cached(command: str) -> Tuple[str, ...]:
+    return tuple(shlex.split(command))
 
 
-def connect_to_server(insecure: bool = False):
-    verify = (
-        (not insecure) if insecure else None
-    )  # set to None so demisto_client will use env var DEMISTO_VERIFY_SSL
-    client = demisto_client.configure(verify_ssl=verify)
+def _to_argv(command: Union[str, List[str]]) -> List[str]:
+    """A list is used as is, a string is split like a shell would (cached, for commands that repeat)"""
+    if not command:
+        raise Exception("cli cannot be empty.")
+    if isinstance(command, list):
+        return command
+    return list(_split_cached(str(command)))
+
+
+def cli(command: Union[str, List[str]]) -> subprocess.CompletedProcess:
+    """
+    Runs the command and raises CalledProcessError if it fails.
+    File descriptors are not closed in the child (close_fds=False) to save the per-fd close loop,
+    so the child inherits any fd marked inheritable - do not call while holding sensitive ones.
+    """
+    return subprocess.run(_to_argv(command), check=True, close_fds=False)
+
+
+async def cli_async(command: Union[str, List[str]]) -> subprocess.CompletedProcess:
+    """Same as `cli`, but awaitable, so several commands can run concurrently, e.g. with asyncio.gather"""
+    run_req = _to_argv(command)
+    process = await asyncio.create_subprocess_exec(*run_req, close_fds=False)
+    return_code = await process.wait()
+    if return_code:
+        raise subprocess.CalledProcessError(return_code, run_req)
+    return subprocess.CompletedProcess(run_req, return_code)
+
+
+def cli_batch(
+    commands: List[Union[str, List[str]]], max_workers: Optional[int] = None
+) -> List[subprocess.CompletedProcess]:
+    """Run independent commands concurrently, returns their results in the order of the given commands"""
+    if not commands:
+        return []
+    with ThreadPoolExecutor(max_workers=max_workers or len(commands)) as executor:
+        return list(executor.map(cli, commands))
+
+
+def _verify_ssl_from_env() -> bool:
+    """The verify_ssl demisto_client defaults to, resolved here so equal settings share a cached client"""
+    verify_env = os.getenv("DEMISTO_VERIFY_SSL")
+    return verify_env.lower() not in ("false", "0", "no") if verify_env else True
+
+
+@lru_cache(maxsize=8)
+def _configure(
+    verify: bool, base_url: Optional[str], api_key: Optional[str]
+) -> "DefaultApi":
+    """Configures a client once per connection details, so its connection pool is reused across connections"""
+    import demisto_client
+
+    return demisto_client.configure(
+        base_url=base_url, api_key=api_key, verify_ssl=verify
+    )
+
+
+def connect_to_server(
+    insecure: bool = False,
+    base_url: Optional[str] = None,
+    api_key: Optional[str] = None,
+    check_version: bool = True,
+):
+    """
+    base_url and api_key default to the DEMISTO_BASE_URL and DEMISTO_API_KEY env vars.
+    Set check_version=False to skip the request verifying the server is reachable.
+    """
+    verify = False if insecure else _verify_ssl_from_env()
+    client = _configure(
+        verify,
+        base_url or os.getenv("DEMISTO_BASE_URL"),
+        api_key or os.getenv("DEMISTO_API_KEY"),
+    )
+    if not check_version:
+        return client
+
+    from demisto_sdk.commands.common.tools import get_demisto_version
+
     demisto_version = get_demisto_version(client)
     if demisto_version == "0":
         raise Exception(
             "Could not connect to XSOAR server. Please check your connection configurations."
         )
     return client
+
+
+def connect_to_servers(servers: List[Dict[str, Any]]) -> List["DefaultApi"]:
+    """
+    Connects to several servers concurrently, so their version checks do not wait for each other.
+    Each item of servers holds the connect_to_server arguments of one server, the clients are returned in the same order.
+    """
+    if not servers:
+        return []
+    with ThreadPoolExecutor(max_workers=len(servers)) as executor:
+        return list(executor.map(lambda server: connect_to_server(**server), servers))
+
+
+# for tests that need a new client (and session)
+connect_to_server.cache_clear = _configure.cache_clear  # type: ignore[attr-defined]